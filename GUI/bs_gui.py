@@ -64,9 +64,11 @@ class BattleshipGUI:
     def _start_game(self, mode: str, ai_type: str):
         self.ai_delay_ms = self.delay_var.get()
         if ai_type == "both":
-            self.controller = GameController("ai_vs_ai")
+            self.controller = GameController("ai_vs_ai",
+                                            move_time=AI_MOVE_TIME)
         else:
-            self.controller = GameController(mode, ai_type)
+            self.controller = GameController(mode, ai_type,
+                                            move_time=AI_MOVE_TIME)
         self._build_game_screen()
         if mode == "ai_vs_ai":
             self._schedule_ai_turn()
@@ -1,5 +1,6 @@
 from GameSettings.bs_settings import Board, GRID_SIZE, SHIPS
 from GameModes.bs_gameModes import SimpleReflexAgent, GoalBasedAgent
+from GameController.bs_scheduler import MoveScheduler
 
 
 # ─────────────────────────────────────────────
@@ -8,10 +9,14 @@ from GameModes.bs_gameModes import SimpleReflexAgent, GoalBasedAgent
 class GameController:
     """Manages game state and turn logic for all modes."""
 
-    def __init__(self, mode: str, ai_type: str = "goal"):
+    def __init__(self, mode: str, ai_type: str = "goal",
+                move_time: float | None = None,
+                game_time: float | None = None):
         """
-        mode    : 'human_vs_ai' | 'ai_vs_ai'
-        ai_type : 'reflex' | 'goal'  (ignored in ai_vs_ai mode)
+        mode      : 'human_vs_ai' | 'ai_vs_ai'
+        ai_type   : 'reflex' | 'goal'  (ignored in ai_vs_ai mode)
+        move_time : seconds each AI may spend per shot   (None = unlimited)
+        game_time : seconds each AI may spend per game   (None = unlimited)
         """
         self.mode     = mode
         self.board_p1 = Board()   # Human or Reflex Agent
@@ -33,6 +38,7 @@ class GameController:
         self.game_over   = False
         self.winner      = None
         self.shot_count  = {"p1": 0, "p2": 0}
+        self.scheduler   = MoveScheduler(move_time, game_time)
 
     def human_shoot(self, r: int, c: int) -> str:
         """Process a human shot at opponent board (board_p2)."""
@@ -60,7 +66,7 @@ class GameController:
             agent = self.agent_p2
             target_board = self.board_p1
 
-        r, c   = agent.choose_shot(target_board)
+        r, c   = self.scheduler.choose_shot(self.turn, agent, target_board)
         result = target_board.receive_shot(r, c)
         agent.receive_result(r, c, result)
         self.shot_count[self.turn] += 1
@@ -0,0 +1,222 @@
+import time
+
+
+# ─────────────────────────────────────────────
+#  MOVE SCHEDULER
+# ─────────────────────────────────────────────
+class MoveScheduler:
+    """
+    Gives each agent a per-move and per-game time budget.
+
+    Agents that implement iter_shots(board) are treated as 'anytime' agents:
+    iter_shots returns an iterable of progressively better (row, col)
+    choices, and the scheduler keeps the latest one, stopping the search
+    once the deadline passes.  Agents with only choose_shot() run to
+    completion — they cannot be interrupted, so any time spent past the
+    deadline is recorded as an overrun.  An anytime agent is only logged
+    when it runs more than `grace` seconds past its deadline, i.e. when a
+    single step of its search ignored the budget.
+
+    With no budget set, every agent is simply asked for choose_shot().
+    """
+
+    def __init__(self, move_time: float | None = None,
+                game_time: float | None = None,
+                grace: float = 0.005, clock=time.perf_counter):
+        """
+        move_time : seconds allowed per shot      (None = unlimited)
+        game_time : seconds allowed per player per game (None = unlimited)
+        grace     : seconds an anytime agent may run past its deadline
+                    before the move counts as an overrun
+        clock     : zero-argument function returning seconds
+        """
+        self.move_time = move_time
+        self.game_time = game_time
+        self.grace     = grace
+        self.clock     = clock
+        self.time_used = {"p1": 0.0, "p2": 0.0}
+        self.overruns  = []   # [{'player', 'move', 'elapsed', 'budget', 'over'}, ...]
+        self._moves    = {"p1": 0, "p2": 0}
+
+    def budget(self, player: str) -> float | None:
+        """Seconds available for the player's next move (None = unlimited)."""
+        limits = []
+        if self.move_time is not None:
+            limits.append(self.move_time)
+        if self.game_time is not None:
+            limits.append(max(0.0, self.game_time - self.time_used[player]))
+        return min(limits) if limits else None
+
+    def choose_shot(self, player: str, agent, board) -> tuple:
+        """Ask the agent for a shot within its budget.  Returns (row, col)."""
+        budget = self.budget(player)
+        start  = self.clock()
+
+        shot = None
+        if budget is not None and hasattr(agent, "iter_shots"):
+            shot = self._run_anytime(agent, board, start, budget)
+        anytime = shot is not None
+        if not anytime:
+            shot = agent.choose_shot(board)
+
+        elapsed = self.clock() - start
+        self.time_used[player] += elapsed
+        self._moves[player]    += 1
+        if budget is not None:
+            over = elapsed - budget
+            if over > (self.grace if anytime else 0.0):
+                self.overruns.append({"player":  player,
+                                      "move":    self._moves[player],
+                                      "elapsed": elapsed,
+                                      "budget":  budget,
+                                      "over":    over})
+        return shot
+
+    def _run_anytime(self, agent, board, start: float,
+                    budget: float) -> tuple | None:
+        """
+        Drain iter_shots() until exhausted or the deadline passes.
+        Returns None if nothing was yielded.
+        """
+        shots = iter(agent.iter_shots(board))
+        shot  = None
+        try:
+            for shot in shots:
+                if self.clock() - start >= budget:
+                    break
+        finally:
+            close = getattr(shots, "close", None)
+            if close is not None:
+                close()
+        return shot
+
+
+# ─────────────────────────────────────────────
+#  SELF-CHECK   (python -m GameController.bs_scheduler)
+# ─────────────────────────────────────────────
+if __name__ == "__main__":
+    import copy
+    import random
+    from GameController.bs_controller import GameController
+    from GameModes.bs_gameModes import _last
+    from GameSettings.bs_settings import GRID_SIZE
+
+    class _FakeClock:
+        """Deterministic clock: time only moves when an agent advances it."""
+        def __init__(self):
+            self.now = 0.0
+        def __call__(self):
+            return self.now
+
+    class _SteppingAgent:
+        """Anytime agent: each further step of its search costs `step` s."""
+        def __init__(self, clock, step, first=0.0):
+            self.clock, self.step, self.first = clock, step, first
+        def iter_shots(self, board):
+            self.clock.now += self.first
+            n = 0
+            while True:
+                yield 0, n
+                n += 1
+                self.clock.now += self.step
+
+    class _PlainAgent:
+        """choose_shot-only agent that takes `cost` s."""
+        def __init__(self, clock, cost):
+            self.clock, self.cost = clock, cost
+        def choose_shot(self, board):
+            self.clock.now += self.cost
+            return 0, 0
+
+    class _EmptyAnytimeAgent:
+        """iter_shots yields nothing; choose_shot must be used instead."""
+        def iter_shots(self, board):
+            return iter([])
+        def choose_shot(self, board):
+            return 1, 1
+
+    # budget(): game budget used up -> zero seconds left
+    s = MoveScheduler(move_time=0.5, game_time=1.0)
+    s.time_used["p1"] = 1.2
+    assert s.budget("p1") == 0.0
+    assert s.budget("p2") == 0.5
+    assert MoveScheduler().budget("p1") is None
+
+    # Early cut-off returns the latest yielded shot, and is not an overrun
+    clock = _FakeClock()
+    s = MoveScheduler(move_time=0.035, grace=0.01, clock=clock)
+    assert s.choose_shot("p1", _SteppingAgent(clock, 0.01), None) == (0, 4)
+    assert s.overruns == []
+    assert abs(s.time_used["p1"] - 0.04) < 1e-9
+
+    # Anytime agent whose first step ignores the deadline is an overrun
+    clock = _FakeClock()
+    s = MoveScheduler(move_time=0.1, clock=clock)
+    assert s.choose_shot("p1", _SteppingAgent(clock, 0.0, first=0.5),
+                         None) == (0, 0)
+    assert len(s.overruns) == 1
+    assert abs(s.overruns[0]["over"] - 0.4) < 1e-9
+
+    # choose_shot-only agent past its deadline is recorded with the excess
+    clock = _FakeClock()
+    s = MoveScheduler(move_time=0.005, clock=clock)
+    assert s.choose_shot("p2", _PlainAgent(clock, 0.02), None) == (0, 0)
+    assert len(s.overruns) == 1
+    rec = s.overruns[0]
+    assert rec["player"] == "p2" and rec["move"] == 1
+    assert abs(rec["over"] - 0.015) < 1e-9
+
+    # Anytime agent that yields nothing falls back to choose_shot
+    s = MoveScheduler(move_time=0.1)
+    assert s.choose_shot("p1", _EmptyAnytimeAgent(), None) == (1, 1)
+
+    # GameController passes budgets through to its scheduler
+    g = GameController("ai_vs_ai", move_time=0.25, game_time=3.0)
+    assert (g.scheduler.move_time, g.scheduler.game_time) == (0.25, 3.0)
+
+    # GoalBasedAgent: a full iter_shots run equals choose_shot, in both phases
+    random.seed(3)
+    g = GameController("ai_vs_ai")
+    phases = set()
+    while not g.game_over:
+        if g.turn == "p2":
+            agent, board = g.agent_p2, g.board_p1
+            phases.add(agent.mode if agent.hit_stack else "hunt")
+            state = random.getstate()
+            full  = _last(copy.deepcopy(agent).iter_shots(board))
+            random.setstate(state)
+            assert full == agent.choose_shot(copy.deepcopy(board))
+            random.setstate(state)
+        g.ai_shoot()
+    assert phases == {"hunt", "target"}, phases
+
+    # A budget that never binds plays the same game as no budget
+    def play(**budget):
+        random.seed(1)
+        g = GameController("ai_vs_ai", **budget)
+        shots = []
+        while not g.game_over:
+            shots.append(g.ai_shoot())
+        return shots
+    assert play() == play(move_time=100.0)
+
+    # Budget 0: every Goal-Based shot is its first yield, valid and new
+    random.seed(5)
+    g = GameController("ai_vs_ai", move_time=0.0)
+    g.scheduler.clock = lambda: 0.0
+    pulls = []
+    iter_shots = g.agent_p2.iter_shots
+    def counted(board):
+        pulls.append(0)
+        for shot in iter_shots(board):
+            pulls[-1] += 1
+            yield shot
+    g.agent_p2.iter_shots = counted
+    while not g.game_over:
+        r, c, result = g.ai_shoot()
+        assert 0 <= r < GRID_SIZE and 0 <= c < GRID_SIZE
+        assert result != "already", (r, c)
+    assert pulls and all(n == 1 for n in pulls), pulls
+    assert g.scheduler.overruns == []
+
+    print("MoveScheduler self-check passed.")
@@ -1,6 +1,15 @@
 
 from GameSettings.bs_settings import Board, GRID_SIZE, SHIPS
 import random
+from collections import deque
+
+
+def _last(shots) -> tuple:
+    """Return the final value of an iterator of shots."""
+    tail = deque(shots, maxlen=1)
+    if not tail:
+        raise ValueError("shot iterator yielded nothing")
+    return tail[0]
 
 # ─────────────────────────────────────────────
 #  SIMPLE REFLEX AGENT
@@ -64,6 +73,17 @@ class GoalBasedAgent:
             return self._target_shot(opponent_board)
         return self._hunt_shot(opponent_board)
 
+    def iter_shots(self, opponent_board: Board):
+        """
+        Anytime interface: yield progressively better (row, col) choices.
+        The last value yielded is the fully-computed shot; a scheduler may
+        stop early and use whatever was yielded most recently.
+        """
+        if self.mode == "target" and self.hit_stack:
+            yield self._target_shot(opponent_board)
+        else:
+            yield from self._iter_hunt_shots(opponent_board, anytime=True)
+
     def receive_result(self, r: int, c: int, result: str):
         """Update internal state based on the outcome of the last shot."""
         if result == "hit":
@@ -77,16 +97,26 @@ class GoalBasedAgent:
 
     # ── Hunt phase ────────────────────────────
     def _hunt_shot(self, board: Board) -> tuple:
+        return _last(self._iter_hunt_shots(board))
+
+    def _iter_hunt_shots(self, board: Board, anytime: bool = False):
         """
         Build a probability density map.
         For each ship still alive, slide it horizontally and vertically
         over the board.  Each valid placement increments those cells.
         The agent then picks the cell with the highest score.
+        With anytime=True, ships are added largest first and the current
+        best cell is also yielded after each one, so an early stop still
+        gets a sensible shot.  Those intermediate picks take the first
+        best cell instead of drawing from the RNG, so an anytime run that
+        is never cut off plays exactly like choose_shot().
         """
         density = [[0]*GRID_SIZE for _ in range(GRID_SIZE)]
         remaining_ships = self._remaining_ships(board)
+        if anytime:
+            remaining_ships.sort(reverse=True)
 
-        for length in remaining_ships:
+        for idx, length in enumerate(remaining_ships):
             # Horizontal placements
             for r in range(GRID_SIZE):
                 for c in range(GRID_SIZE - length + 1):
@@ -101,8 +131,17 @@ class GoalBasedAgent:
                     if self._placement_valid(board, cells):
                         for cr, cc in cells:
                             density[cr][cc] += 1
+            if anytime and idx < len(remaining_ships) - 1:
+                best_cells = self._best_cells(board, density)
+                if best_cells:
+                    yield best_cells[0]
 
         # Pick unshot cell with maximum density score
+        best_cells = self._best_cells(board, density)
+        yield random.choice(best_cells) if best_cells else self._fallback(board)
+
+    def _best_cells(self, board: Board, density: list) -> list:
+        """Return the unshot cells with maximum density score."""
         best_score = -1
         best_cells = []
         for r in range(GRID_SIZE):
@@ -113,8 +152,7 @@ class GoalBasedAgent:
                         best_cells = [(r, c)]
                     elif density[r][c] == best_score:
                         best_cells.append((r, c))
-
-        return random.choice(best_cells) if best_cells else self._fallback(board)
+        return best_cells
 
     # ── Target phase ──────────────────────────
     def _target_shot(self, board: Board) -> tuple:
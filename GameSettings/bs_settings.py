@@ -7,6 +7,8 @@ GRID_SIZE    = 10
 CELL_SIZE    = 40
 SHIPS        = {"Carrier": 5, "Battleship": 4, "Cruiser": 3,
                 "Submarine": 3, "Destroyer": 2}
+AI_MOVE_TIME = 0.5    # per-shot cap for AI agents in the GUI; only slower
+                      # anytime agents are ever cut off by it
 
 # Colours
 BG_DARK      = "#0d1b2a"